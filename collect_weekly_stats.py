@@ -1,8 +1,29 @@
+import json
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
 
+# Upper bound on parallel `gh workflow-stats` calls, to avoid tripping
+# GitHub's secondary rate limit on concurrent requests
+MAX_CONCURRENCY = 16
+
+# Records the date range each output file in a directory was collected for.
+# File names only carry the ISO week of the start date, so the same name can
+# cover different days depending on --start
+COLLECTED_RANGES_FILE = ".collected-ranges.json"
+
+# Serializes status output from concurrent collection workers
+print_lock = threading.Lock()
+
+
+def log(message: str) -> None:
+    """Print a status line without interleaving output from other workers."""
+    with print_lock:
+        print(message, flush=True)
+
 
 def get_weeks_in_range(start_date: str, end_date: str) -> list[tuple[str, str, int]]:
     """
@@ -24,13 +45,14 @@ def get_weeks_in_range(start_date: str, end_date: str) -> list[tuple[str, str, i
     while current <= end:
         week_start = current
         week_end = min(current + timedelta(days=6), end)
-        iso_week = week_start.isocalendar()[1]
-        year = week_start.year
+        # Label weeks with the ISO year, which differs from the calendar year for
+        # dates around new year (e.g. 2024-12-30 is in 2025-W01)
+        iso = week_start.isocalendar()
 
         weeks.append((
             week_start.strftime("%Y-%m-%d"),
             week_end.strftime("%Y-%m-%d"),
-            f"{year}-W{iso_week:02d}"
+            f"{iso.year}-W{iso.week:02d}"
         ))
 
         current = week_end + timedelta(days=1)
@@ -38,6 +60,52 @@ def get_weeks_in_range(start_date: str, end_date: str) -> list[tuple[str, str, i
     return weeks
 
 
+def week_output_file(output_dir: Path, week_num: str, jobs: bool = False) -> Path:
+    """Return the path the stats for a week are written to."""
+    prefix = "job-stats" if jobs else "workflow-stats"
+    return output_dir / f"{prefix}-{week_num}.json"
+
+
+def load_collected_ranges(output_dir: Path) -> dict[str, str]:
+    """Load the date range each output file in output_dir was collected for."""
+    try:
+        return json.loads((output_dir / COLLECTED_RANGES_FILE).read_text())
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_collected_ranges(output_dir: Path, ranges: dict[str, str]) -> None:
+    """Save the date range each output file in output_dir was collected for."""
+    (output_dir / COLLECTED_RANGES_FILE).write_text(json.dumps(ranges, indent=2, sort_keys=True) + "\n")
+
+
+def is_week_collected(week_start: str, week_end: str, output_file: Path,
+                      collected_range: str | None) -> bool:
+    """
+    Check whether a week's stats were collected after they could no longer change.
+
+    A week is closed once all 7 of its days are more than a day in the past,
+    leaving time for runs started on its last day to complete. Weeks truncated
+    by the end date are never closed, since a later end date extends them.
+    Output written before the week closed may be partial, so it only counts if
+    the file was modified after that point, and only if it was collected for
+    the same days (collected_range, as "start..end").
+    """
+    if collected_range != f"{week_start}..{week_end}":
+        return False
+
+    start = datetime.strptime(week_start, "%Y-%m-%d")
+    end = datetime.strptime(week_end, "%Y-%m-%d")
+    if end - start != timedelta(days=6):
+        return False
+
+    closed_at = end + timedelta(days=2)
+    try:
+        return output_file.stat().st_mtime >= closed_at.timestamp()
+    except FileNotFoundError:
+        return False
+
+
 def collect_week_stats(org: str, repo: str, workflow: str,
                        week_start: str, week_end: str, week_num: str,
                        output_dir: Path, jobs: bool = False) -> bool:
@@ -50,10 +118,9 @@ def collect_week_stats(org: str, repo: str, workflow: str,
     Returns:
         True if successful, False otherwise
     """
-    prefix = "job-stats" if jobs else "workflow-stats"
-    output_file = output_dir / f"{prefix}-{week_num}.json"
+    output_file = week_output_file(output_dir, week_num, jobs)
 
-    print(f"Collecting {week_num} ({week_start} to {week_end})...", end=" ", flush=True)
+    label = f"Collecting {week_num} ({week_start} to {week_end})..."
 
     cmd = [
         "gh", "workflow-stats",
@@ -73,32 +140,34 @@ def collect_week_stats(org: str, repo: str, workflow: str,
         result = subprocess.run(
             cmd,
             capture_output=True,
-            text=True,
             timeout=120
         )
 
         if result.returncode == 0 and result.stdout.strip():
-            output_file.write_text(result.stdout)
+            # Write the raw bytes from gh, avoiding a decode/encode round-trip
+            output_file.write_bytes(result.stdout)
 
             # Check if file has meaningful data
-            if output_file.stat().st_size > 100:
-                print(f"✓ ({output_file.stat().st_size} bytes)")
+            size = len(result.stdout)
+            if size > 100:
+                log(f"{label} ✓ ({size} bytes)")
                 return True
             else:
-                print("⚠ (empty)")
+                log(f"{label} ⚠ (empty)")
                 output_file.unlink()
                 return False
         else:
-            print("✗ (failed)")
+            message = f"{label} ✗ (failed)"
             if result.stderr:
-                print(f"  Error: {result.stderr.strip()}")
+                message += f"\n  Error: {result.stderr.decode('utf-8', 'replace').strip()}"
+            log(message)
             return False
 
     except subprocess.TimeoutExpired:
-        print("✗ (timeout)")
+        log(f"{label} ✗ (timeout)")
         return False
     except Exception as e:
-        print(f"✗ (error: {e})")
+        log(f"{label} ✗ (error: {e})")
         return False
 
 
@@ -144,9 +213,24 @@ def main():
         action="store_true",
         help="Collect job statistics instead of workflow run statistics"
     )
+    parser.add_argument(
+        "-c", "--concurrency",
+        type=int,
+        default=8,
+        help="Number of weeks to collect in parallel (default: 8, max: 16 to stay under GitHub's secondary rate limit)"
+    )
+    parser.add_argument(
+        "-f", "--force",
+        action="store_true",
+        help="Re-collect weeks that have already been collected and can no longer change"
+    )
 
     args = parser.parse_args()
 
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    concurrency = min(args.concurrency, MAX_CONCURRENCY)
+
     # Check if gh CLI is installed
     try:
         subprocess.run(["gh", "--version"], capture_output=True, check=True)
@@ -176,22 +260,48 @@ def main():
     print(f"  Date range: {args.start} to {args.end}")
     print(f"  Mode: {'Jobs' if args.jobs else 'Workflow runs'}")
     print(f"  Output directory: {output_dir}")
+    print(f"  Concurrency: {concurrency}")
     print()
 
     # Generate weeks
     weeks = get_weeks_in_range(args.start, args.end)
-    print(f"Collecting data for {len(weeks)} weeks...\n")
+
+    # Closed weeks that were already collected would return the same data, so
+    # skip them rather than spending GitHub API requests on them again
+    collected_ranges = load_collected_ranges(output_dir)
+    skipped = 0
+    if not args.force:
+        pending = []
+        for week_start, week_end, week_num in weeks:
+            output_file = week_output_file(output_dir, week_num, args.jobs)
+            if not is_week_collected(week_start, week_end, output_file,
+                                     collected_ranges.get(output_file.name)):
+                pending.append((week_start, week_end, week_num))
+        skipped = len(weeks) - len(pending)
+        weeks = pending
+
+    print(f"Collecting data for {len(weeks)} weeks ({skipped} already collected)...\n")
 
     # Collect stats for each week
     successful = 0
     failed = 0
 
-    for week_start, week_end, week_num in weeks:
-        if collect_week_stats(args.org, args.repo, args.workflow,
-                             week_start, week_end, week_num, output_dir, args.jobs):
-            successful += 1
-        else:
-            failed += 1
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = {
+            executor.submit(collect_week_stats, args.org, args.repo, args.workflow,
+                            week_start, week_end, week_num, output_dir, args.jobs): (week_start, week_end, week_num)
+            for week_start, week_end, week_num in weeks
+        }
+        for future in as_completed(futures):
+            if future.result():
+                successful += 1
+                week_start, week_end, week_num = futures[future]
+                collected_ranges[week_output_file(output_dir, week_num, args.jobs).name] = f"{week_start}..{week_end}"
+            else:
+                failed += 1
+
+    if successful:
+        save_collected_ranges(output_dir, collected_ranges)
 
     # Summary
     print()
@@ -199,6 +309,7 @@ def main():
     print(f"Collection complete!")
     print(f"  Successful: {successful}")
     print(f"  Failed/Empty: {failed}")
+    print(f"  Skipped (already collected): {skipped}")
     print(f"  Output directory: {output_dir}")
     print()
     if not args.jobs:
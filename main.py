@@ -1,231 +1,383 @@
+from __future__ import annotations
+
 import argparse
-import json
+import hashlib
+import os
 import sys
-from collections import defaultdict
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Iterable, Iterator
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import matplotlib
-import matplotlib.dates as mdates
-import matplotlib.pyplot as plt
-import numpy as np
-import pandas as pd
+import orjson
 
-matplotlib.use('Agg')  # Use non-interactive backend
+# pandas, numpy and matplotlib take hundreds of milliseconds to import, so they
+# are imported in the functions that use them to keep --help and error exits fast
+if TYPE_CHECKING:
+    import pandas as pd
 
 
-def load_workflow_stats(filepaths: list[str]) -> list[dict]:
-    """Load one or more workflow stats JSON files."""
-    data_list = []
+def save_figure(fig, output_file: str, dpi: int) -> None:
+    """Save a figure through a temporary file, so readers never see a partial image."""
+    import matplotlib
 
-    for filepath in filepaths:
-        path = Path(filepath)
-        if not path.exists():
-            print(f"Error: File '{filepath}' not found!", file=sys.stderr)
-            sys.exit(1)
+    output_path = Path(output_file)
+    if output_path.suffix:
+        fmt = output_path.suffix[1:].lower()
+    else:
+        # Like savefig, fall back to the default format and append it as extension
+        fmt = matplotlib.rcParams['savefig.format']
+        output_path = output_path.with_name(f"{output_path.name}.{fmt}")
+
+    # The temporary name doesn't end in the real extension, so pass the format
+    tmp_path = output_path.with_name(f".{output_path.name}.tmp")
+
+    # zlib level 3 encodes much faster than libpng's default of 6 for a
+    # slightly larger file
+    kwargs = {'pil_kwargs': {'compress_level': 3}} if fmt == 'png' else {}
+    try:
+        fig.savefig(tmp_path, format=fmt, dpi=dpi, **kwargs)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _import_pyplot():
+    """Import pyplot configured for rendering plots to files."""
+    import matplotlib
+    matplotlib.use('Agg')  # Use non-interactive backend
+    import matplotlib.pyplot as plt
+
+    # Collapse near-collinear segments when rendering paths
+    plt.rcParams['path.simplify'] = True
+    plt.rcParams['path.simplify_threshold'] = 1.0
+    return plt
+
+
+# Extracted runs of each workflow stats file are cached here, keyed by the
+# file's path, modification time and size, so unchanged weeks are not
+# re-parsed on every run
+CACHE_DIR = Path('.cache')
+
+# Part of every cache key. Bump it whenever the columns or dtypes returned by
+# extract_file_runs change, so entries in the old format are not reused
+CACHE_VERSION = 2
+
+# Cache entries unused for this long are removed, which also clears out
+# entries of input files that were deleted or renamed
+CACHE_MAX_AGE_DAYS = 30
+
+# Maximum number of stats files read and parsed concurrently
+LOAD_WORKERS = 8
 
-        print(f"  Loading: {filepath}")
+# Serializes status output from concurrent loader threads
+print_lock = threading.Lock()
+
+
+def log(message: str) -> None:
+    """Print a status line without interleaving output from other loader threads."""
+    with print_lock:
+        print(message)
+
+
+def _read_stats_file(filepath: str) -> dict:
+    """Read and decode a single stats JSON file, exiting on failure."""
+    path = Path(filepath)
+    if not path.exists():
+        print(f"Error: File '{filepath}' not found!", file=sys.stderr)
+        sys.exit(1)
+
+    log(f"  Loading: {filepath}")
+    try:
+        return orjson.loads(path.read_bytes())
+    except orjson.JSONDecodeError as e:
+        print(f"Error: Invalid JSON in '{filepath}': {e}", file=sys.stderr)
+        sys.exit(1)
+    except Exception as e:
+        print(f"Error: Failed to read '{filepath}': {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+def _load_file_runs(filepath: str, use_cache: bool) -> pd.DataFrame:
+    """Load the runs of a single workflow stats file, from CACHE_DIR if possible."""
+    path = Path(filepath)
+    use_cache = use_cache and path.exists()
+
+    if use_cache:
+        import pandas as pd
+
+        # Hash the absolute path, so same-named files in different directories
+        # get separate entries. The size catches rewrites that land within the
+        # filesystem's timestamp resolution. Pickles are only read back by the
+        # same pandas major version that wrote them
+        stat = path.stat()
+        path_hash = hashlib.blake2b(str(path.resolve()).encode(), digest_size=8).hexdigest()
+        cache_prefix = f"{path_hash}-"
+        pandas_major = pd.__version__.split('.')[0]
+        cache_path = CACHE_DIR / f"{cache_prefix}v{CACHE_VERSION}-pd{pandas_major}-{stat.st_mtime_ns}-{stat.st_size}.pkl"
+        if cache_path.exists():
+            try:
+                runs = pd.read_pickle(cache_path)
+            except Exception:
+                # A corrupt entry is a cache miss; it is replaced below
+                pass
+            else:
+                log(f"  Loading (cached): {filepath}")
+                # Mark the entry as recently used, see _prune_cache
+                os.utime(cache_path)
+                return runs
+
+    runs = extract_file_runs(_read_stats_file(filepath))
+
+    if use_cache:
+        CACHE_DIR.mkdir(exist_ok=True)
+        # Drop entries cached for older versions of this file
+        for stale_path in CACHE_DIR.glob(f"{cache_prefix}*.pkl"):
+            stale_path.unlink(missing_ok=True)
+
+        # Write through a temporary file, so an interrupted run never leaves a
+        # truncated entry behind
+        tmp_path = cache_path.with_name(f".{cache_path.stem}.tmp{cache_path.suffix}")
         try:
-            with open(path, 'r') as f:
-                data = json.load(f)
-                data_list.append(data)
-        except json.JSONDecodeError as e:
-            print(f"Error: Invalid JSON in '{filepath}': {e}", file=sys.stderr)
-            sys.exit(1)
-        except Exception as e:
-            print(f"Error: Failed to read '{filepath}': {e}", file=sys.stderr)
-            sys.exit(1)
+            runs.to_pickle(tmp_path)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
-    return data_list
+    return runs
 
 
-def extract_successful_runs(data_list: list[dict]) -> tuple[list[dict], int, list[dict]]:
-    """Extract all successful workflow runs from one or more data files.
+def _prune_cache() -> None:
+    """Remove cache entries that were not used in the last CACHE_MAX_AGE_DAYS days."""
+    cutoff = time.time() - CACHE_MAX_AGE_DAYS * 24 * 60 * 60
+    for entry in CACHE_DIR.glob('*.pkl'):
+        try:
+            if entry.stat().st_mtime < cutoff:
+                entry.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def load_workflow_stats(filepaths: list[str], use_cache: bool = True) -> Iterator[pd.DataFrame]:
+    """Load the workflow runs of one or more workflow stats JSON files.
+
+    Files are read and parsed on a thread pool, and each yields one DataFrame
+    of its runs, in input order. Only the extracted runs are kept, not the
+    parsed documents. A file's runs are served from CACHE_DIR when it hasn't
+    changed since it was last extracted.
+    """
+    if use_cache:
+        _prune_cache()
+
+    with ThreadPoolExecutor(max_workers=max(1, min(LOAD_WORKERS, len(filepaths)))) as executor:
+        yield from executor.map(_load_file_runs, filepaths, [use_cache] * len(filepaths))
+
+
+# Fields of a workflow run that are used for the analysis
+RUN_COLUMNS = ['id', 'run_started_at', 'duration', 'run_attempt', 'actor']
+
+# Runs shorter than this many seconds (e.g. skipped or cancelled early) are excluded
+MIN_RUN_DURATION = 2 * 60
+
+# GitHub API timestamps are always UTC, e.g. 2025-03-11T17:31:50Z
+RUN_TIMESTAMP_FORMAT = '%Y-%m-%dT%H:%M:%SZ'
+
+
+def _concat_runs(frames: list[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate per-file run DataFrames, tolerating files without any runs."""
+    import pandas as pd
+
+    if not frames:
+        return pd.DataFrame(columns=RUN_COLUMNS + ['success'])
+    return pd.concat(frames, ignore_index=True)
+
+
+def extract_file_runs(data: dict) -> pd.DataFrame:
+    """Extract the successful and failed workflow runs of a single data file.
 
     Returns:
-        tuple: (list of successful runs with run_attempt==1,
+        DataFrame with one row per run and a boolean 'success' column
+    """
+    import pandas as pd
+
+    # Navigate to the conclusions section
+    conclusions = data.get('workflow_runs_stats_summary', {}).get('conclusions', {})
+
+    frames = []
+    # Failed runs are only needed for the success rate calculation
+    for conclusion in ('success', 'failure'):
+        workflow_runs = (conclusions.get(conclusion) or {}).get('workflow_runs') or []
+        if workflow_runs:
+            # Only project the fields we need rather than flattening every run attribute
+            runs = pd.DataFrame(workflow_runs, columns=RUN_COLUMNS)
+            # Set dtypes explicitly instead of letting pandas infer them per column.
+            # run_attempt can be missing, so it is nullable
+            runs = runs.astype({'id': 'int64', 'run_attempt': 'Int16'})
+            runs['duration'] = pd.to_numeric(runs['duration'], downcast='integer')
+            frames.append(runs.assign(success=conclusion == 'success'))
+
+    return _concat_runs(frames)
+
+
+def extract_successful_runs(run_frames: Iterable[pd.DataFrame]) -> tuple[pd.DataFrame, int, pd.DataFrame]:
+    """Extract all successful workflow runs from the runs of one or more data files.
+
+    Returns:
+        tuple: (DataFrame of successful runs with run_attempt==1,
                 total count of successful runs including retries,
-                list of all runs (successful and failed) with run_attempt==1 for success rate calculation)
+                DataFrame of all runs (successful and failed) with run_attempt==1 for success rate calculation)
+    """
+    import pandas as pd
+
+    all_runs = _concat_runs(list(run_frames))
+    is_success = all_runs['success'].astype(bool)
+
+    # Exlcude very fast runs. Failed runs without a duration are kept.
+    duration = all_runs['duration'].fillna(0)
+    long_enough = (duration >= MIN_RUN_DURATION) | (~is_success & (duration == 0))
+
+    # Count all successful runs, including retries
+    total_runs_count = int((is_success & long_enough).sum())
+
+    # To get comparable timings we nly pick the run attempt 1. This means we only pick runs that passed without
+    # retry, and due to the flakyness of CI this reduces the number of runs we use for stats by about half.
+    first_attempt = (all_runs['run_attempt'] == 1).fillna(False) & all_runs['run_started_at'].fillna('').astype(bool)
+
+    # All runs (success + failure) with run_attempt==1. Successful runs are
+    # moved first so they win when the same run ID shows up under both conclusions.
+    attempt_runs = all_runs[long_enough & first_attempt].sort_values('success', ascending=False, kind='stable')
+
+    # Remove duplicates based on run ID. The successful runs are a subset of
+    # these, so a single hash-based pass deduplicates both result frames.
+    attempt_runs = attempt_runs.drop_duplicates(subset='id', ignore_index=True)
+
+    # Parse timestamps once here so downstream code gets datetime64 columns. The
+    # explicit format keeps pandas on its fast fixed-format parser.
+    attempt_runs['date'] = pd.to_datetime(attempt_runs['run_started_at'], format=RUN_TIMESTAMP_FORMAT, utc=True, cache=True)
+
+    runs_for_rate = attempt_runs[['date', 'id', 'success']]
+    runs = attempt_runs.loc[attempt_runs['success'].astype(bool), ['date', 'duration', 'id', 'actor']].reset_index(drop=True)
+
+    # Durations of successful runs are never missing, and a few hundred actors
+    # repeat across thousands of runs, so store both compactly
+    runs = runs.astype({'duration': 'int32', 'actor': 'category'})
+
+    return runs, total_runs_count, runs_for_rate
+
+
+def compute_bucket_stats(df: pd.DataFrame, df_rate: pd.DataFrame, bucket_days: int = 1) -> pd.DataFrame:
+    """Aggregate run durations and success rates into buckets of bucket_days days.
+
+    Buckets are anchored at the Unix epoch so the duration and success rate
+    series share the same bins.
+
+    Args:
+        df: Successful workflow runs with a duration_minutes column
+        df_rate: All runs (success and failure) for success rate calculation
+        bucket_days: Number of days per bucket
+
+    Returns:
+        DataFrame with one row per bucket containing at least one run, with columns
+        date, mean, std, count, success_count, total_count and success_rate
     """
-    all_runs = []
-    total_runs_count = 0
-    all_runs_for_rate = []  # All runs (success + failure) with run_attempt==1
-
-    for data in data_list:
-        # Navigate to the conclusions section
-        conclusions = data.get('workflow_runs_stats_summary', {}).get('conclusions', {})
-
-        # Process successful runs
-        success_data = conclusions.get('success', {})
-        if success_data:
-            workflow_runs = success_data.get('workflow_runs', [])
-
-            for run in workflow_runs:
-                # Extract the date from run_started_at
-                run_started_at = run.get('run_started_at')
-                duration = run.get('duration')
-
-                # Exlcude very fast runs.
-                if int(duration) < 2*60:
-                    continue
-
-                # Count this run in the total
-                total_runs_count += 1
-
-                run_attempt = run.get('run_attempt')
-
-                # Add to all_runs_for_rate if run_attempt==1
-                if run_attempt == 1 and run_started_at:
-                    all_runs_for_rate.append({
-                        'date': run_started_at,
-                        'success': True,
-                        'id': run.get('id'),
-                    })
-
-                # To get comparable timings we nly pick the run attempt 1. This means we only pick runs that passed without
-                # retry, and due to the flakyness of CI this reduces the number of runs we use for stats by about half.
-                if run_attempt != 1:
-                    continue
-
-                if run_started_at and duration is not None:
-                    all_runs.append({
-                        'date': run_started_at,
-                        'duration': duration,
-                        'id': run.get('id'),
-                        'actor': run.get('actor'),
-                    })
-
-        # Process failed runs (for success rate calculation)
-        failure_data = conclusions.get('failure', {})
-        if failure_data:
-            workflow_runs = failure_data.get('workflow_runs', [])
-
-            for run in workflow_runs:
-                run_started_at = run.get('run_started_at')
-                duration = run.get('duration')
-
-                # Exlcude very fast runs.
-                if duration and int(duration) < 2*60:
-                    continue
-
-                run_attempt = run.get('run_attempt')
-
-                # Add to all_runs_for_rate if run_attempt==1
-                if run_attempt == 1 and run_started_at:
-                    all_runs_for_rate.append({
-                        'date': run_started_at,
-                        'success': False,
-                        'id': run.get('id'),
-                    })
-
-    # Remove duplicates based on run ID
-    seen_ids = set()
-    unique_runs = []
-    for run in all_runs:
-        if run['id'] not in seen_ids:
-            seen_ids.add(run['id'])
-            unique_runs.append(run)
-
-    # Remove duplicates from all_runs_for_rate
-    seen_ids_rate = set()
-    unique_runs_for_rate = []
-    for run in all_runs_for_rate:
-        if run['id'] not in seen_ids_rate:
-            seen_ids_rate.add(run['id'])
-            unique_runs_for_rate.append(run)
-
-    return unique_runs, total_runs_count, unique_runs_for_rate
-
-
-def plot_durations(runs: list[dict], total_runs: int, all_runs_for_rate: list[dict], output_file: str = "workflow_durations.png", bucket_days: int = 1):
+    import pandas as pd
+
+    # The successful runs are a subset of df_rate, so attach their durations and
+    # compute duration and success rate statistics in a single resample pass
+    all_runs = df_rate.merge(df[['id', 'duration_minutes']], on='id', how='left')
+
+    # A Timedelta rule is a fixed-length frequency, unlike 'D', which newer pandas
+    # treats as a calendar day that ignores origin
+    stats = all_runs.set_index('date').resample(pd.Timedelta(days=bucket_days), origin='epoch').agg(
+        mean=('duration_minutes', 'mean'),
+        std=('duration_minutes', 'std'),
+        count=('duration_minutes', 'count'),
+        success_count=('success', 'sum'),
+        total_count=('success', 'size'),
+    ).reset_index()
+
+    # resample emits every bin in the date range; drop the ones without runs
+    stats = stats[stats['total_count'] > 0]
+    return stats.assign(success_rate=(stats['success_count'] / stats['total_count']) * 100)
+
+
+def plot_durations(df: pd.DataFrame, total_runs: int, df_rate: pd.DataFrame, output_file: str = "workflow_durations.png", bucket_days: int = 1, dpi: int = 150, show_rate: bool = True):
     """Plot the workflow durations by date with success rate overlay.
 
     Args:
-        runs: List of successful workflow run data (run_attempt==1 only)
+        df: Successful workflow runs (run_attempt==1 only)
         total_runs: Total number of successful runs including retries
-        all_runs_for_rate: List of all runs (success and failure) for success rate calculation
+        df_rate: All runs (success and failure) for success rate calculation
         output_file: Output filename for the plot
         bucket_days: Number of days to group data by (default: 1 for daily)
+        dpi: Resolution of the saved image
+        show_rate: Whether to overlay the success rate on a secondary axis
     """
-    if not runs:
+    import matplotlib.dates as mdates
+
+    plt = _import_pyplot()
+
+    if df.empty:
         print("No data to plot!", file=sys.stderr)
         sys.exit(1)
 
-    # Convert to pandas DataFrame for easier manipulation
-    df = pd.DataFrame(runs)
-    df['date'] = pd.to_datetime(df['date'])
-    df = df.sort_values('date')
-
     # Convert duration from seconds to minutes for better readability
-    df['duration_minutes'] = df['duration'] / 60
+    df = df.assign(duration_minutes=df['duration'] / 60)
 
-    # Group by bucket_days and calculate statistics
-    if bucket_days == 1:
-        # Daily grouping
-        df['bucket'] = df['date'].dt.date
-        bucket_label = 'Daily'
-    else:
-        # Group by N days
-        min_date = df['date'].min()
-        df['bucket'] = ((df['date'] - min_date).dt.days // bucket_days) * bucket_days
-        df['bucket'] = min_date + pd.to_timedelta(df['bucket'], unit='D')
-        bucket_label = f'{bucket_days}-Day'
-
-    bucket_stats = df.groupby('bucket').agg({
-        'duration_minutes': ['mean', 'std', 'count']
-    }).reset_index()
-    bucket_stats.columns = ['date', 'mean', 'std', 'count']
-
-    # Convert date back to datetime for plotting
-    bucket_stats['date'] = pd.to_datetime(bucket_stats['date'])
-
-    # Calculate success rate per bucket
-    df_rate = pd.DataFrame(all_runs_for_rate)
-    df_rate['date'] = pd.to_datetime(df_rate['date'])
-
-    # Group by the same bucket logic
-    if bucket_days == 1:
-        df_rate['bucket'] = df_rate['date'].dt.date
-    else:
-        min_date_rate = df_rate['date'].min()
-        df_rate['bucket'] = ((df_rate['date'] - min_date_rate).dt.days // bucket_days) * bucket_days
-        df_rate['bucket'] = min_date_rate + pd.to_timedelta(df_rate['bucket'], unit='D')
-
-    rate_stats = df_rate.groupby('bucket').agg({
-        'success': ['sum', 'count']
-    }).reset_index()
-    rate_stats.columns = ['date', 'success_count', 'total_count']
-    rate_stats['success_rate'] = (rate_stats['success_count'] / rate_stats['total_count']) * 100
-    rate_stats['date'] = pd.to_datetime(rate_stats['date'])
-
-    # Create the plot with two y-axes
+    bucket_label = 'Daily' if bucket_days == 1 else f'{bucket_days}-Day'
+    stats = compute_bucket_stats(df, df_rate, bucket_days)
+
+    # Duration bars only exist for buckets with at least one successful run
+    bucket_stats = stats[stats['count'] > 0]
+    rate_stats = stats
+
+    # Hand matplotlib plain ndarrays. Tz-aware dates would otherwise come out as an
+    # object array of Timestamps, so they are taken as UTC datetime64 instead
+    bar_dates = bucket_stats['date'].to_numpy(dtype='datetime64[ns]')
+
+    # Create the plot
     fig, ax1 = plt.subplots(figsize=(14, 8))
+    fig.set_layout_engine('constrained')
 
     # Primary axis: Duration bar chart with error bars
-    ax1.bar(bucket_stats['date'], bucket_stats['mean'],
-            yerr=bucket_stats['std'],
+    ax1.bar(bar_dates, bucket_stats['mean'].to_numpy(),
+            yerr=bucket_stats['std'].to_numpy(),
             alpha=0.7,
             color='#2E86AB',
             edgecolor='#1a5278',
             linewidth=1.5,
             error_kw={'ecolor': '#d62828', 'linewidth': 2, 'capsize': 5, 'alpha': 0.8},
             width=bucket_days * 0.8,
+            rasterized=True,
             label='Avg Duration')
 
-    # Secondary axis: Success rate line
-    ax2 = ax1.twinx()
-    ax2.plot(rate_stats['date'], rate_stats['success_rate'],
-             color='#06A77D', linewidth=2.5, marker='o', markersize=6,
-             label='Success Rate', alpha=0.9)
-
     # Formatting for primary axis (duration)
     ax1.set_xlabel('Date', fontsize=12, fontweight='bold')
     ax1.set_ylabel('Average Duration (minutes)', fontsize=12, fontweight='bold', color='#2E86AB')
     ax1.tick_params(axis='y', labelcolor='#2E86AB')
 
-    # Formatting for secondary axis (success rate)
-    ax2.set_ylabel('Success Rate (%)', fontsize=12, fontweight='bold', color='#06A77D')
-    ax2.tick_params(axis='y', labelcolor='#06A77D')
-    ax2.set_ylim(0, 100)
+    handles, labels = ax1.get_legend_handles_labels()
+
+    if show_rate:
+        # Secondary axis: Success rate line
+        ax2 = ax1.twinx()
+        rate_dates = rate_stats['date'].to_numpy(dtype='datetime64[ns]')
+        ax2.plot(rate_dates, rate_stats['success_rate'].to_numpy(),
+                 color='#06A77D', linewidth=2.5, marker='o', markersize=6,
+                 label='Success Rate', alpha=0.9)
+
+        # Formatting for secondary axis (success rate)
+        ax2.set_ylabel('Success Rate (%)', fontsize=12, fontweight='bold', color='#06A77D')
+        ax2.tick_params(axis='y', labelcolor='#06A77D')
+        ax2.set_ylim(0, 100)
+
+        rate_handles, rate_labels = ax2.get_legend_handles_labels()
+        handles += rate_handles
+        labels += rate_labels
 
     # Title
     ax1.set_title(f'{bucket_label} Average Workflow Run Durations - Successful Runs Only',
@@ -240,18 +392,17 @@ def plot_durations(runs: list[dict], total_runs: int, all_runs_for_rate: list[di
     ax1.grid(True, alpha=0.3, linestyle='--', axis='y')
 
     # Add legend
-    lines1, labels1 = ax1.get_legend_handles_labels()
-    lines2, labels2 = ax2.get_legend_handles_labels()
-    ax1.legend(lines1 + lines2, labels1 + labels2, loc='upper right')
+    ax1.legend(handles, labels, loc='upper right')
 
     # Add statistics as text
+    duration_summary = df['duration_minutes'].agg(['mean', 'median', 'min', 'max', 'std'])
     stats_text = f"Successful Initial Runs (attempt=1): {len(df)}\n"
     overall_success_rate = (len(df) / len(df_rate) * 100) if len(df_rate) > 0 else 0
     stats_text += f"Overall Success Rate: {overall_success_rate:.1f}%\n"
-    stats_text += f"Avg Duration: {df['duration_minutes'].mean():.1f} min\n"
-    stats_text += f"Min Duration: {df['duration_minutes'].min():.1f} min\n"
-    stats_text += f"Max Duration: {df['duration_minutes'].max():.1f} min\n"
-    stats_text += f"Overall Std Dev: {df['duration_minutes'].std():.1f} min"
+    stats_text += f"Avg Duration: {duration_summary['mean']:.1f} min\n"
+    stats_text += f"Min Duration: {duration_summary['min']:.1f} min\n"
+    stats_text += f"Max Duration: {duration_summary['max']:.1f} min\n"
+    stats_text += f"Overall Std Dev: {duration_summary['std']:.1f} min"
 
     ax1.text(0.02, 0.98, stats_text, transform=ax1.transAxes,
              fontsize=10, verticalalignment='top',
@@ -264,10 +415,8 @@ def plot_durations(runs: list[dict], total_runs: int, all_runs_for_rate: list[di
              fontsize=9, verticalalignment='bottom', horizontalalignment='right',
              style='italic', alpha=0.7)
 
-    plt.tight_layout()
-
     # Save the plot
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    save_figure(fig, output_file, dpi)
     print(f"Plot saved to: {output_file}")
 
     # Show summary statistics
@@ -277,11 +426,11 @@ def plot_durations(runs: list[dict], total_runs: int, all_runs_for_rate: list[di
     retry_rate = ((total_runs - len(df)) / total_runs * 100) if total_runs > 0 else 0
     print(f"Retry rate (successful runs): {retry_rate:.1f}%")
     print(f"Date range: {df['date'].min().strftime('%Y-%m-%d')} to {df['date'].max().strftime('%Y-%m-%d')}")
-    print(f"Average duration: {df['duration_minutes'].mean():.2f} minutes")
-    print(f"Median duration: {df['duration_minutes'].median():.2f} minutes")
-    print(f"Minimum duration: {df['duration_minutes'].min():.2f} minutes")
-    print(f"Maximum duration: {df['duration_minutes'].max():.2f} minutes")
-    print(f"Standard deviation: {df['duration_minutes'].std():.2f} minutes")
+    print(f"Average duration: {duration_summary['mean']:.2f} minutes")
+    print(f"Median duration: {duration_summary['median']:.2f} minutes")
+    print(f"Minimum duration: {duration_summary['min']:.2f} minutes")
+    print(f"Maximum duration: {duration_summary['max']:.2f} minutes")
+    print(f"Standard deviation: {duration_summary['std']:.2f} minutes")
 
 
 def load_job_stats(filepaths: list[str]) -> list[tuple[str, dict]]:
@@ -290,41 +439,30 @@ def load_job_stats(filepaths: list[str]) -> list[tuple[str, dict]]:
     Returns:
         List of tuples: (filename/week_identifier, data)
     """
-    data_list = []
+    with ThreadPoolExecutor(max_workers=max(1, min(LOAD_WORKERS, len(filepaths)))) as executor:
+        documents = list(executor.map(_read_stats_file, filepaths))
 
-    for filepath in filepaths:
-        path = Path(filepath)
-        if not path.exists():
-            print(f"Error: File '{filepath}' not found!", file=sys.stderr)
-            sys.exit(1)
-
-        print(f"  Loading: {filepath}")
-        try:
-            with open(path, 'r') as f:
-                data = json.load(f)
-                # Extract week identifier from filename (e.g., "2026-W01" from "job-stats-2026-W01.json")
-                filename = path.stem
-                week_id = filename.replace('job-stats-', '')
-                data_list.append((week_id, data))
-        except json.JSONDecodeError as e:
-            print(f"Error: Invalid JSON in '{filepath}': {e}", file=sys.stderr)
-            sys.exit(1)
-        except Exception as e:
-            print(f"Error: Failed to read '{filepath}': {e}", file=sys.stderr)
-            sys.exit(1)
+    # Extract week identifier from filename (e.g., "2026-W01" from "job-stats-2026-W01.json")
+    data_list = [
+        (Path(filepath).stem.replace('job-stats-', ''), data)
+        for filepath, data in zip(filepaths, documents)
+    ]
 
     # Sort by week identifier
     data_list.sort(key=lambda x: x[0])
     return data_list
 
 
-def extract_job_durations(data_list: list[tuple[str, dict]]) -> dict:
+def extract_job_durations(data_list: list[tuple[str, dict]]) -> pd.DataFrame:
     """Extract job durations over time from multiple job stats files.
 
     Returns:
-        dict: {job_name: [(week_id, avg_duration_seconds, run_count), ...]}
+        Long-form DataFrame with one row per job and week, with columns
+        job, week, avg (average duration in seconds) and count (number of runs)
     """
-    job_durations = defaultdict(list)
+    import pandas as pd
+
+    rows = []
 
     for week_id, data in data_list:
         if 'workflow_jobs_stats_summary' not in data:
@@ -334,59 +472,68 @@ def extract_job_durations(data_list: list[tuple[str, dict]]) -> dict:
         jobs = data['workflow_jobs_stats_summary']
 
         for job in jobs:
-            job_name = job['name']
-            avg_duration = job['execution_duration_stats']['avg']
-            run_count = job['total_runs_count']
+            rows.append({
+                'job': job['name'],
+                'week': week_id,
+                'avg': job['execution_duration_stats']['avg'],
+                'count': job['total_runs_count'],
+            })
 
-            # Only include jobs with actual runs
-            if run_count > 0 and avg_duration > 0:
-                job_durations[job_name].append((week_id, avg_duration, run_count))
+    df = pd.DataFrame(rows, columns=['job', 'week', 'avg', 'count'])
 
-    return dict(job_durations)
+    # Only include jobs with actual runs
+    return df[(df['count'] > 0) & (df['avg'] > 0)].reset_index(drop=True)
 
 
-def plot_job_durations(job_durations: dict, output_file: str = "job_durations.png", top_n: int = 10):
+def plot_job_durations(job_durations: pd.DataFrame, output_file: str = "job_durations.png", top_n: int = 10, dpi: int = 150):
     """Plot line graphs for the top N slowest jobs over time.
 
     Args:
-        job_durations: Dict of {job_name: [(week_id, avg_duration_seconds, run_count), ...]}
+        job_durations: Long-form DataFrame with job, week, avg and count columns
         output_file: Output filename for the plot
         top_n: Number of top slowest jobs to plot
+        dpi: Resolution of the saved image
     """
-    if not job_durations:
+    import numpy as np
+
+    plt = _import_pyplot()
+
+    if job_durations.empty:
         print("No job duration data to plot!", file=sys.stderr)
         sys.exit(1)
 
-    # Calculate overall average duration for each job
-    job_avg_durations = {}
-    for job_name, durations in job_durations.items():
-        # Weight by run count
-        total_duration_weighted = sum(dur * count for _, dur, count in durations)
-        total_runs = sum(count for _, _, count in durations)
-        if total_runs > 0:
-            job_avg_durations[job_name] = total_duration_weighted / total_runs
+    # Calculate overall average duration for each job, weighted by run count
+    job_stats = job_durations.assign(weighted=job_durations['avg'] * job_durations['count']) \
+        .groupby('job', sort=False) \
+        .agg(wsum=('weighted', 'sum'), n=('count', 'sum'))
+    job_avg_durations = job_stats['wsum'] / job_stats['n']
 
     # Get top N slowest jobs
-    slowest_jobs = sorted(job_avg_durations.items(), key=lambda x: x[1], reverse=True)[:top_n]
-    slowest_job_names = [name for name, _ in slowest_jobs]
+    slowest_jobs = job_avg_durations.sort_values(ascending=False, kind='stable').head(top_n)
+    slowest_job_names = slowest_jobs.index.tolist()
 
     print(f"\nTop {top_n} slowest jobs (by weighted average):")
-    for i, (name, avg_dur) in enumerate(slowest_jobs, 1):
+    for i, (name, avg_dur) in enumerate(slowest_jobs.items(), 1):
         print(f"  {i}. {name}: {avg_dur/60:.1f} minutes")
 
+    # Rows of the plotted jobs, in week order. A job can have several rows for the
+    # same week when files from different workflows are combined, so the rows are
+    # plotted as-is rather than pivoted into one value per week
+    runs_by_job = job_durations[job_durations['job'].isin(slowest_job_names)].groupby('job', sort=False)
+
     # Create the plot - adjust figure size to accommodate legend below
     fig, ax = plt.subplots(figsize=(18, 10))
+    fig.set_layout_engine('constrained')
 
     # Use a color palette
     colors = plt.cm.tab10(np.linspace(0, 1, top_n))
 
-    # Plot each job
+    # Plot each job over the weeks it ran in
     for idx, job_name in enumerate(slowest_job_names):
-        durations = job_durations[job_name]
-        weeks = [d[0] for d in durations]
-        avg_durations_min = [d[1] / 60 for d in durations]  # Convert to minutes
+        job_rows = runs_by_job.get_group(job_name)
+        avg_durations_min = job_rows['avg'].to_numpy() / 60  # Convert to minutes
 
-        ax.plot(weeks, avg_durations_min,
+        ax.plot(job_rows['week'].to_numpy(), avg_durations_min,
                 marker='o', linewidth=2, markersize=6,
                 label=job_name, color=colors[idx], alpha=0.8)
 
@@ -407,18 +554,14 @@ def plot_job_durations(job_durations: dict, output_file: str = "job_durations.pn
     ax.legend(loc='upper center', bbox_to_anchor=(0.5, -0.15),
               ncol=ncol, fontsize=9, framealpha=0.9)
 
-    # Adjust layout to make room for legend below
-    plt.tight_layout()
-    plt.subplots_adjust(bottom=0.2)
-
     # Save the plot
-    plt.savefig(output_file, dpi=300, bbox_inches='tight')
+    save_figure(fig, output_file, dpi)
     print(f"\nPlot saved to: {output_file}")
 
     # Print summary statistics
     print("\n=== Summary Statistics ===")
-    print(f"Number of weeks analyzed: {len(set(w for durations in job_durations.values() for w, _, _ in durations))}")
-    print(f"Total unique jobs: {len(job_durations)}")
+    print(f"Number of weeks analyzed: {job_durations['week'].nunique()}")
+    print(f"Total unique jobs: {job_durations['job'].nunique()}")
     print(f"Jobs plotted: {len(slowest_job_names)}")
 
 
@@ -455,6 +598,22 @@ def main():
         default=10,
         help='Number of top slowest jobs to plot (default: 10) - only for job mode'
     )
+    parser.add_argument(
+        '--dpi',
+        type=int,
+        default=150,
+        help='Resolution of the output image in dots per inch (default: 150)'
+    )
+    parser.add_argument(
+        '--no-rate',
+        action='store_true',
+        help='Plot only the durations, without the success rate overlay - only for workflow mode'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Re-parse all workflow stats files instead of using extracted runs cached in .cache/ - only for workflow mode'
+    )
 
     args = parser.parse_args()
 
@@ -477,27 +636,29 @@ def main():
         print("Extracting job durations...")
         job_durations = extract_job_durations(data_list)
 
-        if job_durations:
+        if not job_durations.empty:
             print("Creating plot...")
-            plot_job_durations(job_durations, args.output, args.top_n)
+            plot_job_durations(job_durations, args.output, args.top_n, args.dpi)
         else:
             print("No job data to plot!", file=sys.stderr)
             sys.exit(1)
     else:
         # Workflow statistics mode (original behavior)
         print(f"Loading workflow stats from {len(args.input_files)} file(s)...")
-        data_list = load_workflow_stats(args.input_files)
+        run_frames = load_workflow_stats(args.input_files, use_cache=not args.no_cache)
 
         print("Extracting successful runs...")
-        runs, total_runs, all_runs_for_rate = extract_successful_runs(data_list)
+        # run_frames is consumed lazily, so loading happens during extraction
+        runs, total_runs, all_runs_for_rate = extract_successful_runs(run_frames)
 
         print(f"Found {len(runs)} successful initial runs (run_attempt=1, after deduplication)")
 
-        if runs:
+        if not runs.empty:
             print("Creating plot...")
             if args.bucket_days != 1:
                 print(f"Grouping data into {args.bucket_days}-day buckets...")
-            plot_durations(runs, total_runs, all_runs_for_rate, args.output, args.bucket_days)
+            plot_durations(runs, total_runs, all_runs_for_rate, args.output, args.bucket_days, args.dpi,
+                           show_rate=not args.no_rate)
         else:
             print("No successful runs to plot!", file=sys.stderr)
             sys.exit(1)